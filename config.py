@@ -99,4 +99,10 @@ NOTIFICATION_SOUND_FILE = "notification.wav"
 
 CHECK_INTERVAL_SECONDS = 60
 
-SEEN_NEWS_FILE = "seen_news.json"
\ No newline at end of file
+SEEN_NEWS_FILE = "seen_news.json"
+
+LOG_FILE = "crypto_news_bot.log"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = "text"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
\ No newline at end of file
@@ -0,0 +1,84 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+TEXT_LOG_FORMAT = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonLineFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(log_file: str, level: str = "INFO", log_format: str = "text",
+                  max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3) -> logging.handlers.QueueListener:
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    numeric_level = getattr(logging, str(level).upper(), None)
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
+
+    text_formatter = logging.Formatter(TEXT_LOG_FORMAT)
+    if log_format == "jsonl":
+        file_formatter = JsonLineFormatter()
+    else:
+        file_formatter = text_formatter
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    file_handler.setLevel(numeric_level)
+    file_handler.setFormatter(file_formatter)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(text_formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+
+    if logging.getLevelName(str(level).upper()) != numeric_level:
+        logging.warning("Unknown LOG_LEVEL '%s'. Falling back to 'INFO'.", level)
+    if log_format not in ("text", "jsonl"):
+        logging.warning("Unknown LOG_FORMAT '%s'. Falling back to 'text'.", log_format)
+
+    return _listener
+
+
+def stop_logging():
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -7,29 +7,19 @@ import pytz
 from tzlocal import get_localzone
 
 import config
+from log_setup import setup_logging
 from news_fetcher import NewsFetcher
 from news_analyzer import NewsAnalyzer
 from notifier import Notifier
 from persistence import SeenNewsManager
 
-log_format = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
-log_formatter = logging.Formatter(log_format)
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-for handler in logger.handlers[:]:
-    logger.removeHandler(handler)
-
-file_handler = logging.FileHandler("crypto_news_bot.log", encoding='utf-8')
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(log_formatter)
-logger.addHandler(file_handler)
-
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.WARNING)
-console_handler.setFormatter(log_formatter)
-logger.addHandler(console_handler)
+setup_logging(
+    config.LOG_FILE,
+    level=config.LOG_LEVEL,
+    log_format=config.LOG_FORMAT,
+    max_bytes=config.LOG_MAX_BYTES,
+    backup_count=config.LOG_BACKUP_COUNT,
+)
 
 try:
     import colorama
@@ -78,10 +68,10 @@ class CryptoNewsBot:
                 config.MIN_DISPLAY_IMPORTANCE_LEVEL = default_level
                 self.min_importance_numeric = config.IMPORTANCE_ORDER[default_level]
 
-            logging.info(f"Minimum display importance level: {config.MIN_DISPLAY_IMPORTANCE_LEVEL} (Order >= {self.min_importance_numeric})")
+            logging.info("Minimum display importance level: %s (Order >= %d)", config.MIN_DISPLAY_IMPORTANCE_LEVEL, self.min_importance_numeric)
             logging.info("All components initialized successfully.")
-            logging.info(f"News check interval: {self.check_interval} seconds.")
-            logging.info(f"Initial seen news count: {self.seen_news_manager.get_seen_count()}")
+            logging.info("News check interval: %s seconds.", self.check_interval)
+            logging.info("Initial seen news count: %d", self.seen_news_manager.get_seen_count())
 
         except ValueError as ve:
             logging.critical(f"Bot failed to initialize! Configuration error: {ve}")
@@ -118,7 +108,7 @@ class CryptoNewsBot:
             article_title = article.get('title', 'No Title')
 
             if not article_url:
-                logging.warning(f"Skipping article with no URL: '{article_title}'")
+                logging.warning("Skipping article with no URL: '%s'", article_title)
                 continue
 
             is_new = self.seen_news_manager.is_new(article_url)
@@ -131,7 +121,7 @@ class CryptoNewsBot:
                     article_sentiment = analysis.get('sentiment', 'N/A')
 
                 except Exception as e:
-                    logging.error(f"Error analyzing article ('{article_title}'): {e}", exc_info=True)
+                    logging.error("Error analyzing article ('%s'): %s", article_title, e, exc_info=True)
                     self.seen_news_manager.add_seen(article_url)
                     continue
 
@@ -145,11 +135,11 @@ class CryptoNewsBot:
                         high_importance_numeric = config.IMPORTANCE_ORDER.get("High", 99)
                         if article_importance_numeric >= high_importance_numeric:
                             should_display = True
-                            logging.info(f"DISPLAYING Neutral article ({article_importance_level}) due to high importance: '{article_title}'")
+                            logging.info("DISPLAYING Neutral article (%s) due to high importance: '%s'", article_importance_level, article_title)
 
                 if should_display:
                     displayed_news_count += 1
-                    logging.info(f"New, important, and displayable article found ({article_importance_level}, {article_sentiment}): '{article_title}'")
+                    logging.info("New, important, and displayable article found (%s, %s): '%s'", article_importance_level, article_sentiment, article_title)
 
                     self.display_news(article, analysis)
 
@@ -165,9 +155,9 @@ class CryptoNewsBot:
                         self.notifier.play_notification()
 
                 elif is_important_enough and article_sentiment == "Neutral":
-                    logging.debug(f"Neutral article ({article_importance_level}, importance score: {article_importance_numeric}) not displayed due to not meeting high importance criteria: '{article_title}'")
+                    logging.debug("Neutral article (%s, importance score: %d) not displayed due to not meeting high importance criteria: '%s'", article_importance_level, article_importance_numeric, article_title)
                 elif not is_important_enough:
-                    logging.debug(f"New article found but below minimum importance level ({article_importance_level}). Not displaying: '{article_title}'")
+                    logging.debug("New article found but below minimum importance level (%s). Not displaying: '%s'", article_importance_level, article_title)
 
                 self.seen_news_manager.add_seen(article_url)
 
@@ -175,9 +165,9 @@ class CryptoNewsBot:
         self.is_first_run = False
 
         if displayed_news_count > 0:
-            logging.info(f"Processed {displayed_news_count} new, important, and displayed articles.")
+            logging.info("Processed %d new, important, and displayed articles.", displayed_news_count)
         else:
-            logging.info(f"No new articles to display were found in this check cycle (Total {total_fetched} articles fetched from API).")
+            logging.info("No new articles to display were found in this check cycle (Total %d articles fetched from API).", total_fetched)
 
 
     def format_published_date_local(self, published_at_str: str) -> str:
@@ -196,7 +186,7 @@ class CryptoNewsBot:
             formatted_date = local_dt.strftime('%Y-%m-%d %H:%M:%S %Z')
             return formatted_date
         except ValueError:
-            logging.warning(f"Could not parse date '{published_at_str}' as ISO format. Using original.")
+            logging.warning("Could not parse date '%s' as ISO format. Using original.", published_at_str)
             return published_at_str
         except Exception as e:
             logging.error(f"Unexpected error during date conversion: {e}", exc_info=False)
@@ -237,7 +227,7 @@ class CryptoNewsBot:
         print(f"   Minimum Importance Level: {config.MIN_DISPLAY_IMPORTANCE_LEVEL}")
         print(f"   Check Interval: {self.check_interval} seconds")
         print("   Displaying new, important (Positive/Negative or high-importance Neutral) news in console.")
-        print("   Check 'crypto_news_bot.log' for detailed logs and errors.")
+        print(f"   Check '{config.LOG_FILE}' for detailed logs and errors.")
         print("   Press CTRL+C to exit.")
         print("*"*30 + "\n")
 
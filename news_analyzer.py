@@ -3,8 +3,6 @@ import logging
 import re
 from typing import Dict, List, Tuple, Any
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 class NewsAnalyzer:
 
     def __init__(self, tracked_coins: Dict[str, str], importance_keywords: Dict[str, int], importance_thresholds: Dict[str, int]):
@@ -12,9 +10,9 @@ class NewsAnalyzer:
         self.importance_keywords = {k.lower(): v for k, v in importance_keywords.items()}
         self.importance_thresholds = sorted(importance_thresholds.items(), key=lambda item: item[1], reverse=True)
         logging.info("NewsAnalyzer initialized.")
-        logging.debug(f"Tracked coins: {list(self.tracked_coins.keys())}")
-        logging.debug(f"Importance keywords: {self.importance_keywords}")
-        logging.debug(f"Importance thresholds: {self.importance_thresholds}")
+        logging.debug("Tracked coins: %s", list(self.tracked_coins.keys()))
+        logging.debug("Importance keywords: %s", self.importance_keywords)
+        logging.debug("Importance thresholds: %s", self.importance_thresholds)
 
 
     def analyze_sentiment(self, text: str) -> Tuple[str, float]:
@@ -34,7 +32,7 @@ class NewsAnalyzer:
 
             return sentiment, round(polarity, 3)
         except Exception as e:
-            logging.error(f"Error during sentiment analysis: {e}")
+            logging.error("Error during sentiment analysis: %s", e)
             return "Error", 0.0
 
     def identify_coins(self, text: str) -> List[str]:
@@ -74,7 +72,7 @@ class NewsAnalyzer:
                 importance_level = level
                 break
 
-        logging.debug(f"Importance analysis complete. Score: {total_score}, Level: {importance_level}, Keywords: {found_keywords}")
+        logging.debug("Importance analysis complete. Score: %d, Level: %s, Keywords: %s", total_score, importance_level, found_keywords)
         return importance_level, total_score
 
     def analyze_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
@@ -97,5 +95,5 @@ class NewsAnalyzer:
             "importance": importance,
             "importance_score": importance_score,
         }
-        logging.debug(f"Article analysis complete: '{title[:50]}...' -> {analysis_results}")
+        logging.debug("Article analysis complete: '%.50s...' -> %s", title, analysis_results)
         return analysis_results
\ No newline at end of file
@@ -2,8 +2,6 @@ import requests
 import logging
 from typing import List, Dict, Optional
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 class NewsFetcher:
 
     def __init__(self, api_key: str, endpoint: str):
@@ -23,7 +21,7 @@ class NewsFetcher:
             'pageSize': min(page_size, 100),
         }
         try:
-            logging.debug(f"Sending request to News API: {self.endpoint} Params: {params}")
+            logging.debug("Sending request to News API: %s Params: %s", self.endpoint, params)
             response = self.session.get(self.endpoint, params=params, timeout=15)
             response.raise_for_status()
 
@@ -31,7 +29,7 @@ class NewsFetcher:
 
             if data.get("status") == "ok":
                 articles = data.get("articles", [])
-                logging.info(f"Successfully fetched {len(articles)} articles (Query: '{query[:50]}...').")
+                logging.info("Successfully fetched %d articles (Query: '%.50s...').", len(articles), query)
                 valid_articles = [
                     article for article in articles
                     if article.get('title') and article.get('url')
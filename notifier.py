@@ -17,8 +17,6 @@ else:
         logging.warning("Neither winsound nor playsound found. Sound notifications disabled.")
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 class Notifier:
 
     def __init__(self, sound_file: str, enabled: bool = True):
@@ -3,8 +3,6 @@ import os
 import logging
 from typing import Set
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 class SeenNewsManager:
 
     def __init__(self, filepath: str):